@@ -17,6 +17,7 @@ Description:    This program is designed to manage a list
                 The program supports the following functions/routines:
 
                 add from to:        Adds a new interval to the list
+                addBatch from to ...: Adds several intervals to the list
                 remove from to:     Removes an interval from the list
                 clear:              Clears the interval list
                 enableDebugging:    Enables extra debugging logs
@@ -25,12 +26,15 @@ Description:    This program is designed to manage a list
                 exit:               Exits the program
                 help:               Displays a list of commands
 
-Other details:  This program uses a Python list to store the start and end
-                values of each interval in a single list.  Since each interval
-                has two entries (a "start" and "end" value), the interval
-                list will always have an even number of entries.
+Other details:  This program uses a single Python array of signed 64-bit
+                integers (array.array('q')) to store the start and end values of
+                each interval.  Since each interval has two entries (a "start"
+                and "end" value), the interval list will always have an even
+                number of entries.  Storing the values packed in an array rather
+                than as individual int objects referenced from a list uses
+                considerably less memory.
 
-                Python list objects are similar to a C++ vector or a
+                Python arrays (like list objects) are similar to a C++ vector or a
                 Java ArrayList object in that the list entries are stored
                 in a dynamic array.  This means that insertions and deletions
                 in the list require copying of all members after the
@@ -38,8 +42,16 @@ Other details:  This program uses a Python list to store the start and end
                 point are shifted).  Therefore, insertion and deletion operations
                 are O(n) where n is the number of members in the interval list.
 
+                Since the interval list is always sorted, the positions where
+                the start and end values belong are located with a binary search
+                (the bisect module) rather than by walking the list, so locating
+                an interval is O(log n).  A balanced tree or a sorted container
+                (e.g. sortedcontainers.SortedList) would also make the edits
+                themselves O(log n), but would add a third-party dependency to
+                what is otherwise a standard library only script.
+
                 One improvement to this implementation would be to use a
-                linked list rather than a Python list object for storing the
+                linked list rather than a Python array object for storing the
                 intervals.  This would make insertion/deletion operations O(1)
                 instead of O(n).  However, Python does not have a built-in
                 linked list type, so this would require implementing a separate
@@ -51,7 +63,7 @@ Other details:  This program uses a Python list to store the start and end
                 next node refereces (and previous node references if using a
                 doubly linked list).
 
-                Using the built-in Python list seems reasonable assuming that the
+                Using the built-in Python array seems reasonable assuming that the
                 total possible inputs for the interval start and ending points is
                 small.  For example, if the intervals represented hours in a day
                 then each hour can be represented by a number between 0-23, and at
@@ -59,20 +71,60 @@ Other details:  This program uses a Python list to store the start and end
                 representing at most 12 possible intervals.
 
                 Finally, as written, this implementation can handle both positive
-                and negative inputs for interval start and end values.
+                and negative inputs for interval start and end values, as long as
+                they fit in a signed 64-bit integer.
 """
 
+import array
+from bisect import bisect_left, bisect_right
 import cmd
+import functools
+import itertools
 import logging
+import sys
+
+# Interval start/end values are stored as signed 64-bit integers
+MIN_INTERVAL_VALUE = -2 ** 63
+MAX_INTERVAL_VALUE = 2 ** 63 - 1
+
+@functools.lru_cache(maxsize=256)
+def _parseIntervalArgs(cmdName, args):
+    """
+    Parse and validate the <start> <end> arguments of the add/remove commands
+
+    Returns a (start, end, errorMessage) tuple.  If the arguments are
+    valid, errorMessage is None.  Otherwise start and end are None and
+    errorMessage describes the problem.
+
+    Scripted input tends to repeat the same commands, so results are
+    cached on the raw argument string.
+    """
+    cmdArgs = args.split()
+
+    if len(cmdArgs) < 2:
+        return None, None, f"Error - Need 2 arguments (start and end)\nUsage: {cmdName} <start> <end>"
+
+    try:
+        start, end = int(cmdArgs[0]), int(cmdArgs[1])
+    except ValueError:
+        return None, None, "Error - Inputs must be integer values"
+
+    if start < MIN_INTERVAL_VALUE or end > MAX_INTERVAL_VALUE:
+        return None, None, f"Error - Inputs must be between {MIN_INTERVAL_VALUE} and {MAX_INTERVAL_VALUE}"
 
-class EditIntervalsProgram(object, cmd.Cmd):
+    if start >= end:
+        return None, None, f"Error - start must be < end\nUsage: {cmdName} <start> <end>"
+
+    return start, end, None
+
+class EditIntervalsProgram(cmd.Cmd):
 
     def __init__(self):
         # Instantiate the cmd.Cmd super class
-        super(object, self).__init__()
+        super().__init__()
 
-        # Initialize the initial interval list to an empty list
-        self._m_IntervalList = []
+        # Initialize the initial interval list to an empty array of signed 64-bit integers
+        self._m_IntervalList = array.array('q')
 
         # Set log message format and get a logger instance
         logging.basicConfig(format='%(message)s\n', level=logging.INFO)
@@ -84,7 +136,8 @@ class EditIntervalsProgram(object, cmd.Cmd):
         """
 
         # Debug message that simply prints the entire interval list
-        self._m_Logger.debug("Intervals list: %s", self._m_IntervalList)
+        if self._m_Logger.isEnabledFor(logging.DEBUG):
+            self._m_Logger.debug("Intervals list: %s", self._m_IntervalList.tolist())
 
         """
         Intervals are stored in a single list in pairs.
@@ -97,45 +150,33 @@ class EditIntervalsProgram(object, cmd.Cmd):
         outputString = [(1, 3), (5, 8), (10, 12)]
         """
 
+        intervalList = self._m_IntervalList
+
         """
-        Python String objects are immutable and Python does not have a StringBuilder
-        type class so use a list to create the output string dynamically and
-        then convert the list to a string.
-        See: https://pythonadventures.wordpress.com/tag/stringbuffer/
+        Build the output string in a single join over the interval pairs.
+        join() is given a list rather than a generator so that it can size
+        the result up front instead of first collecting the generator.
         """
-
-        outputList = ['[']
-        for i in range (0, len(self._m_IntervalList), 2):
-            outputList.append( \
-                '({intervalStart}, {intervalEnd})'.format( \
-                intervalStart=self._m_IntervalList[i], \
-                intervalEnd=self._m_IntervalList[i + 1] \
-            ))
-            outputList.append(',')
-
-        # Properly append the final character in outputString
-        if len(self._m_IntervalList) == 0:
-            # If the list IS empty then simply append ']' so that
-            # the resulting string will be '[]'
-            outputList.append(']')
-        else:
-            # If the list IS NOT empty then replace the last ',' with ']' so that
-            # the resulting string will be sometihng like '[(1, 2), (3, 4)]'
-            outputList[-1] = ']'
-
-        # Create the output string from outputList
-        outputString = ''.join(outputList)
+        intervalPairs = ', '.join([
+            f'({intervalStart}, {intervalEnd})'
+            for intervalStart, intervalEnd in zip(intervalList[0::2], intervalList[1::2])
+        ])
+        outputString = f'[{intervalPairs}]'
 
         # Display output to screen
         self._m_Logger.info("Intervals: %s", outputString)
 
     def addInterval(self, start, end):
+        # Bind the interval list and logger to locals for the body of this method
+        intervalList = self._m_IntervalList
+        logger = self._m_Logger
+
         # Error case - if start >= end then this is not a valid interval
         if start >= end:
-            self._m_Logger.error("Error - start >= end")
+            logger.error("Error - start >= end")
             return
 
-        if len(self._m_IntervalList) == 0 or self._m_IntervalList[-1] < start:
+        if not intervalList or intervalList[-1] < start:
             """
             Case #1: empty list
 
@@ -154,12 +195,33 @@ class EditIntervalsProgram(object, cmd.Cmd):
 
             Example:
             Current interval list: [5, 10]
-            Call: add(8, 10)
-            Updated intervals list after adding start and end: [5, 10, 8, 10]
+            Call: add(12, 15)
+            Updated intervals list after adding start and end: [5, 10, 12, 15]
+
+            Intervals are commonly added in increasing order, so this case
+            is handled first and returns straight away, without searching
+            the interval list.
             """
-            self._m_IntervalList.append(start)
-            self._m_IntervalList.append(end)
-        elif self._m_IntervalList[0] > end:
+            intervalList.extend((start, end))
+            return
+
+        """
+        If the new interval is already covered by an existing interval
+        then the interval list does not change, so return straight away.
+        coveringIdx is the last entry <= start; it is the start of the
+        covering interval if it is even and that interval's end is >= end.
+
+        Example:
+        Current interval list: [2, 10]
+        Call: add(3, 5)
+        coveringIdx = 0
+        Updated intervals list: [2, 10]
+        """
+        coveringIdx = bisect_right(intervalList, start) - 1
+        if coveringIdx >= 0 and (coveringIdx & 1) == 0 and intervalList[coveringIdx + 1] >= end:
+            return
+
+        if intervalList[0] > end:
             """
             Case #3:
 
@@ -172,214 +234,116 @@ class EditIntervalsProgram(object, cmd.Cmd):
             Call: add(2, 3)
             Updated intervals list after adding start and end: [2, 3, 5, 10]
             """
-            self._m_IntervalList.insert(0, start)
-            self._m_IntervalList.insert(1, end)
+            intervalList[0:0] = array.array('q', (start, end))
         else:
             """
-            In this case, the interval must be inserted
-            somewhere within the list of existing intervals
-            """
+            In this case, the interval must be merged into the list of
+            existing intervals.
 
-            """
-            Determine where the start and end values
-            should be interted into the interval list
-            """
-            startInsertionIdx = 0
-            endInsertionIdx = 0
+            Sweep over the existing intervals that overlap (or touch) the
+            new interval, widening start and end to cover them, and then
+            replace all of them with the single merged interval.
 
-            while startInsertionIdx < len(self._m_IntervalList) and self._m_IntervalList[startInsertionIdx] < start:
-                startInsertionIdx += 1
+            Since each interval takes up two entries, the bisect results are
+            rounded to interval boundaries:
+            mergeStartIdx is the first interval whose end is >= start.
+            mergeEndIdx is one past the last interval whose start is <= end.
+            """
+            mergeStartIdx = bisect_left(intervalList, start) & ~1
+            mergeEndIdx = (bisect_right(intervalList, end, mergeStartIdx) + 1) & ~1
+
+            # Skip building the debug message arguments unless debugging is enabled
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "mergeStartIdx = %d, mergeEndIdx = %d, listLen = %d",
+                    mergeStartIdx,
+                    mergeEndIdx,
+                    len(intervalList)
+                )
 
-            endInsertionIdx = startInsertionIdx
+            """
+            If no existing interval overlaps the new interval then
+            mergeStartIdx == mergeEndIdx and the new interval is simply
+            inserted at that position.
 
-            while endInsertionIdx < len(self._m_IntervalList) and self._m_IntervalList[endInsertionIdx] < end:
-                endInsertionIdx += 1
+            Example:
+            Current interval list: [2, 3, 8, 10, 15, 18]
+            Call: add(5, 12)
+            mergeStartIdx = 2, mergeEndIdx = 4
+            Merged interval: (5, 12)
+            Updated intervals list: [2, 3, 5, 12, 15, 18]
 
-            self._m_Logger.debug(
-				"startInsertionIdx = %d, endInsertionIdx = %d, listLen = %d",
-				startInsertionIdx,
-				endInsertionIdx,
-				len(self._m_IntervalList)
-			)
+            Example:
+            Current interval list: [2, 3, 8, 10]
+            Call: add(3, 9)
+            mergeStartIdx = 0, mergeEndIdx = 4
+            Merged interval: (2, 10)
+            Updated intervals list: [2, 10]
 
+            Example:
+            Current interval list: [2, 3, 8, 10]
+            Call: add(5, 6)
+            mergeStartIdx = 2, mergeEndIdx = 2
+            Merged interval: (5, 6)
+            Updated intervals list: [2, 3, 5, 6, 8, 10]
             """
-            Determine if startInsertionIdx and endInsertionIdx are the
-            beginning or end of an existing interval.  Since an interval
-            comprises of two entries (a beginning and end), an interval
-            is inserted as a pair of entries the intervals list.  If
-            startInsertionIdx/endInsertionIdx is even, then it is the
-            start of an interval.  If startInsertionIdx/endInsertionIdx
-            is odd, then it is the end of an interval.
-            """
-            isStartIntervalEnd = False
-            isEndIntervalEnd = False
-
-            if startInsertionIdx % 2 == 1:
-                isStartIntervalEnd = True
+            if mergeStartIdx < mergeEndIdx:
+                start = min(start, intervalList[mergeStartIdx])
+                end = max(end, intervalList[mergeEndIdx - 1])
 
-            if endInsertionIdx % 2 == 1:
-                isEndIntervalEnd = True
+            intervalList[mergeStartIdx:mergeEndIdx] = array.array('q', (start, end))
 
-            """
-            Insert the beginning of the new interval
-            (start) into the interval list
-            """
-            currentIdx = startInsertionIdx
-
-            if start < self._m_IntervalList[currentIdx]:
-                """
-                Case #1: start does not exist in the interval list
-
-                If the current value at currentIdx is the beginning
-                of an interval, then we simply insert start before the
-                value at currentIdx.
-
-                Example:
-                Current interval list: [2, 3, 8, 10]
-                Call: add(4, 5)
-                currentIdx = 2
-                Updated intervals list after adding start: [2, 3, 4, 8, 10], currentIdx = 3
-
-                Otherwise, the value at currentIdx is the end of an
-                interval.  Since this value is the end of an interval
-                we do nothing since (no need to insert it again).
-
-                Example:
-                Current interval list: [2, 3, 8, 10]
-                Call: add(3, 5)
-                currentIdx = 1
-                Updated intervals list after adding start: [2, 3, 8, 10], currentIdx = 1
-
-                Note: The insertion of end (if necessary) will handle completing the interval
-                """
-                if isStartIntervalEnd == False:
-                    self._m_IntervalList.insert(currentIdx, start)
-                    currentIdx += 1
-            else:
-                """
-                Case #2: start is present in the interval list
-
-                If start is the end an existing interval, then we
-                simply delete the value at currentIdx.
-
-                Example:
-                Current interval list: [2, 3, 8, 10]
-                Call: add(8, 10)
-                currentIdx = 2
-                Updated intervals list after adding start: [2, 3, 10], currentIdx = 2
-
-                Otherwise, we leave the value of start in the
-                interval list since it is the beginning of an
-                existing interval (no need to insert it again).
-
-                Example:
-                Current interval list: [2, 3, 8, 10]
-                Call: add(3, 5)
-                currentIdx = 1
-                Updated intervals list after adding start: [2, 3, 8, 10], currentIdx = 2
-
-                Note: The insertion of end (if necessary) will handle completing the interval
-                """
-                if isStartIntervalEnd == True:
-                    del self._m_IntervalList[currentIdx]
-                else:
-                    currentIdx += 1
+    def addIntervals(self, intervals):
+        """
+        Add a batch of (start, end) pairs to the interval list
 
-            """
-            Delete any entries in the interval list where
-            that entry > start AND entry < end
+        Rather than calling addInterval once per pair, the existing
+        intervals and the new pairs are sorted together and then merged
+        in a single sweep, which is O(n log n) for the whole batch.
+        """
+        newIntervals = []
+        for start, end in intervals:
+            # Error case - if start >= end then this is not a valid interval
+            if start >= end:
+                self._m_Logger.error("Error - start >= end")
+                return
+            newIntervals.append((start, end))
 
-            Example:
-            Current interval list: [2, 3, 8, 10, 15, 18]
-            Call: add(5, 12)
-            currentIdx = 2
-            Updated intervals list after adding start and removing interim entries: [2, 3, 5, 15, 18], currentIdx = 3
+        existingIntervals = zip(self._m_IntervalList[0::2], self._m_IntervalList[1::2])
 
-            Note: The insertion of end (if necessary) will handle completing the interval
-            """
-            while currentIdx < len(self._m_IntervalList) and self._m_IntervalList[currentIdx] < end:
-                del self._m_IntervalList[currentIdx]
+        """
+        Sweep the sorted intervals and emit merged disjoint intervals.
+        An interval whose start is <= the end of the last emitted
+        interval overlaps (or touches) it and extends it, otherwise it
+        begins a new interval.
 
-            """
-            Insert the end of the new interval
-            (end) into the interval list
-            """
-            if end > self._m_IntervalList[-1]:
-                """
-                Case #1: end is greater than the largest value in the list
-
-                If end is greater than the last value in the list
-                then simply append it to the end of the interval list.
-
-                Example:
-                Current interval list: [5, 10]
-                Call: add(6, 15)
-                After inserting start: interval list = [5, 10], currentIdx = 1
-                After interting start and end: [5, 15]
-                """
-                self._m_IntervalList.append(end)
-            elif end < self._m_IntervalList[currentIdx]:
-                """
-                Case #2: end is not present in the list but
-                         is < the largest value in the list
-
-                If end < value at currentIdx AND the value at
-                currentIdx is the beginning of an interval,
-                then end should be inserted before the value
-                at currentIdx.
-
-                Example:
-                Current interval list: [2, 3, 8, 10]
-                Call: add(6, 7)
-                currentIdx = 2
-                After inserting start: interval list = [2, 3, 6, 8, 10], currentIdx = 3
-                After interting end: [2, 3, 6, 7, 8, 10]
-
-                Otherwise, do nothing since end is already
-                encompassed within an existing interval.
-
-                Example:
-                Current interval list: [2, 3, 8, 10]
-                Call: add(8, 9)
-                currentIdx = 2
-                After inserting start: interval list = [2, 3, 8, 10], currentIdx = 3
-                After interting end: [2, 3, 8, 10]
-                """
-                if isEndIntervalEnd == False:
-                    self._m_IntervalList.insert(currentIdx, end)
+        Example:
+        Current interval list: [1, 3, 10, 12]
+        Call: addIntervals([(2, 5), (5, 6), (8, 9)])
+        Sorted intervals: (1, 3), (2, 5), (5, 6), (8, 9), (10, 12)
+        Updated intervals list: [1, 6, 8, 9, 10, 12]
+        """
+        mergedList = array.array('q')
+        for start, end in sorted(itertools.chain(existingIntervals, newIntervals)):
+            if mergedList and start <= mergedList[-1]:
+                if end > mergedList[-1]:
+                    mergedList[-1] = end
             else:
-                """
-                Case #3: end is present in the interval list
-
-                If end is present in the interval list AND
-                end is the beginning of an existing interval,
-                then delete this value from the interval list
-                since end will be encompassed by the new interval.
-
-                Example:
-                Current interval list: [5, 10]
-                Call: add(2, 5)
-                After inserting start (and deleting interim entries): interval list = [2, 10], currentIdx = 1
-                After interting end: [2, 10]
-
-                Otherwise, do nothing since end is already
-                encompassed within an existing interval.
-
-                Example:
-                Current interval list: [5, 10]
-                Call: add(5, 8)
-                After inserting start (and deleting interim entries): interval list = [5, 10], currentIdx = 1
-                After interting end: [5, 10]
-                """
-                if isEndIntervalEnd == False:
-                    del self._m_IntervalList[currentIdx]
+                mergedList.append(start)
+                mergedList.append(end)
+
+        self._m_IntervalList[:] = mergedList
 
     def removeInterval(self, start, end):
+        # Bind the interval list and logger to locals for the body of this method
+        intervalList = self._m_IntervalList
+        logger = self._m_Logger
+
         """
         Error case: start >= end, invalid interval
         """
         if start >= end:
-            self._m_Logger.error("Error: start >= end")
+            logger.error("Error: start >= end")
             return
 
         """
@@ -389,7 +353,7 @@ class EditIntervalsProgram(object, cmd.Cmd):
 
         In either of these cases, do nothing.
         """
-        if len(self._m_IntervalList) == 0 or self._m_IntervalList[-1] < start:
+        if not intervalList or intervalList[-1] < start:
             return
 
         else:
@@ -402,190 +366,75 @@ class EditIntervalsProgram(object, cmd.Cmd):
             Determine where the start and end values
             should be interted into the interval list
             """
-            startInsertionIdx = 0
-            endInsertionIdx = 0
-
-            while startInsertionIdx < len(self._m_IntervalList) and self._m_IntervalList[startInsertionIdx] < start:
-                startInsertionIdx += 1
-
-            endInsertionIdx = startInsertionIdx
-
-            while endInsertionIdx < len(self._m_IntervalList) and self._m_IntervalList[endInsertionIdx] < end:
-                endInsertionIdx += 1
-
-            self._m_Logger.debug \
-			(
-				"startInsertionIdx = %d, endInsertionIdx = %d, listLen = %d",
-				startInsertionIdx,
-				endInsertionIdx,
-				len(self._m_IntervalList)
-			)
-
-            isStartIntervalEnd = False
-            isEndIntervalEnd = False
-
-            if startInsertionIdx % 2 == 1:
-                isStartIntervalEnd = True
-
-            if endInsertionIdx % 2 == 1:
-                isEndIntervalEnd = True
-
-            currentIdx = startInsertionIdx
-
-            if start < self._m_IntervalList[currentIdx]:
-                """
-                Case #1: start does not exist in the interval list
-
-                If the current value at currentIdx is the end
-                of an interval, then we simply insert start before the
-                value at currentIdx.
-
-                Example:
-                Current interval list: [2, 3, 8, 10]
-                Call: remove(7, 9)
-                currentIdx = 2
-                Updated intervals list after adding start: [2, 3, 8, 10], currentIdx = 2
-                Updated intervals list after deleting interim values: [2, 3, 10], currentIdx = 2
-                Updated intervals list after adding end: [2, 3, 9, 10], currentIdx = 2
-
-                Otherwise, the value at currentIdx is the end of an
-                interval.  Since this value is the end of an interval
-                we do nothing since (no need to insert it again).
-
-                Example:
-                Current interval list: [2, 3, 8, 10]
-                Call: remove(9, 10)
-                currentIdx = 3
-                Updated intervals list after adding start: [2, 3, 8, 9, 10]
-
-                Note: The insertion of end (if necessary) will handle completing the interval
-                """
-                if isStartIntervalEnd == True:
-                    self._m_IntervalList.insert(currentIdx, start)
-                    currentIdx += 1
-            else:
-                """
-                Case #2: start does exist in the interval list
-
-                If the current value at currentIdx is the beginning
-                of an interval, then we simply delete the value at currentIdx.
-
-                Example:
-                Current interval list: [2, 3, 8, 10]
-                Call: remove(8, 9)
-                currentIdx = 2
-                Updated intervals list after adding start: [2, 3, 10], currentIdx = 2
-
-                Otherwise, the value at currentIdx is the end of an
-                interval.  Since this value is the end of an interval
-                we do nothing since (no need to insert it again).
-
-                Example:
-                Current interval list: [2, 3, 8, 10]
-                Call: remove(3, 5)
-                currentIdx = 1
-                Updated intervals list after adding start: [2, 3, 8, 10], currentIdx = 2
-
-                Note: The insertion of end (if necessary) will handle completing the interval
-                """
-                if isStartIntervalEnd == False:
-                    del self._m_IntervalList[currentIdx]
-                else:
-                    currentIdx += 1
+            startInsertionIdx = bisect_left(intervalList, start)
+
+            """
+            bisect_right places endInsertionIdx after end if end is already
+            present in the interval list, so that the existing entry is
+            replaced along with the interim entries.  Whether end is then
+            put back is decided by its parity.
+            """
+            endInsertionIdx = bisect_right(intervalList, end, startInsertionIdx)
+
+            # Skip building the debug message arguments unless debugging is enabled
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "startInsertionIdx = %d, endInsertionIdx = %d, listLen = %d",
+                    startInsertionIdx,
+                    endInsertionIdx,
+                    len(intervalList)
+                )
+
+            isStartIntervalEnd = bool(startInsertionIdx & 1)
+            isEndIntervalEnd = bool(endInsertionIdx & 1)
 
             """
-            Delete any entries in the interval list where
-            that entry > start and entry < end
+            Every entry between startInsertionIdx and endInsertionIdx lies
+            within the removed interval, so that whole range is replaced
+            in a single slice assignment.
+
+            start is kept only if it falls inside an existing interval
+            (it becomes the new end of that interval).
+            end is kept only if it falls inside an existing interval
+            (it becomes the new beginning of that interval).
 
             Example:
             Current interval list: [2, 3, 8, 10, 15, 18]
             Call: remove(9, 16)
-            After inserting start: interval list = [2, 3, 8, 9, 10, 15, 18], currentIdx = 3
-            After adding start and removing interim entries: [2, 3, 8, 9, 18], currentIdx = 3
+            startInsertionIdx = 3, endInsertionIdx = 5
+            Replacement: [9, 16]
+            Updated intervals list: [2, 3, 8, 9, 16, 18]
+
+            Example:
+            Current interval list: [5, 10]
+            Call: remove(8, 10)
+            startInsertionIdx = 1, endInsertionIdx = 2
+            Replacement: [8]
+            Updated intervals list: [5, 8]
 
-            Note: The insertion of end (if necessary) will handle completing the interval
+            Example:
+            Current interval list: [2, 4, 5, 10]
+            Call: remove(3, 5)
+            startInsertionIdx = 1, endInsertionIdx = 3
+            Replacement: [3, 5]
+            Updated intervals list: [2, 3, 5, 10]
             """
-            while currentIdx < len(self._m_IntervalList) and self._m_IntervalList[currentIdx] < end:
-                del self._m_IntervalList[currentIdx]
-
-            if currentIdx >= len(self._m_IntervalList):
-                """
-                Case #1: end is greater than the largest value in the list
-
-                If end is greater than the last value in the list
-                then do nothing.
-
-                Example:
-                Current interval list: [5, 10, 16, 18]
-                Call: remove(17, 20)
-                After inserting start: interval list = [5, 10, 16, 17, 18], currentIdx = 4
-                After removing interim entries: interval list = [5, 10, 16, 17], currentIdx = 4
-                No need to do anything with end.
-                """
-                pass
-            elif end < self._m_IntervalList[currentIdx]:
-                """
-                Case #2: end is not present in the list but
-                         is not the largest value in the list
-
-                If end < value at currentIdx AND the value at
-                currentIdx is the end of an interval,
-                then end should be inserted before the value
-                at currentIdx.
-
-                Example:
-                Current interval list: [2, 3, 8, 12]
-                Call: remove(9, 10)
-                currentIdx = 3
-                After inserting start: interval list = [2, 3, 8, 9, 12], currentIdx = 4
-                After interting end: [2, 3, 8, 9, 10, 12]
-
-                Otherwise, do nothing since end is already
-                the end of an existing interval.
-
-                Example:
-                Current interval list: [2, 3, 8, 12]
-                Call: remove(10, 11)
-                currentIdx = 3
-                After inserting start: interval list = [2, 3, 8, 10, 11, 12], currentIdx = 4
-                After interting end: [2, 3, 8, 10, 11, 12]
-                """
-                if isEndIntervalEnd == True:
-                    self._m_IntervalList.insert(currentIdx, end)
-            else:
-                """
-                Case #3: end is present in the interval list
-
-                If end is present in the interval list AND
-                end is the end of an existing interval,
-                then delete this value from the interval list
-                since end will be encompassed by the new interval.
-
-                Example:
-                Current interval list: [5, 10]
-                Call: remove(8, 10)
-                currentIdx = 1
-                After inserting start: interval list = [5, 8, 10], currentIdx = 2
-                After interting end: [5, 8]
-
-                Otherwise, do nothing since end is already
-                the beginning of an existing interval.
-
-                Example:
-                Current interval list: [2, 4, 5, 10]
-                Call: remove(3, 5)
-                currentIdx = 1
-                After inserting start (and deleting interim entries): interval list = [2, 3, 5, 10], currentIdx = 2
-                After interting end: [2, 3, 5, 10]
-                """
-                if isEndIntervalEnd == True:
-                    del self._m_IntervalList[currentIdx]
+            replacement = array.array('q')
+
+            if isStartIntervalEnd == True:
+                replacement.append(start)
+
+            if isEndIntervalEnd == True:
+                replacement.append(end)
+
+            intervalList[startInsertionIdx:endInsertionIdx] = replacement
 
     def clearList(self):
         """
         Empty the interval list and return it
         """
-        del self._m_IntervalList[:]
+        # Replace the interval list with a new empty array rather than deleting its contents
+        self._m_IntervalList = array.array('q')
 
         # Display output to screen
         self.printIntervals()
@@ -597,36 +446,59 @@ class EditIntervalsProgram(object, cmd.Cmd):
                <start> must be less than <end>
         """
 
+        """
+        Get user input and check for input errors
+        """
+        start, end, errorMessage = _parseIntervalArgs('add', args)
+
+        if errorMessage is not None:
+            self._m_Logger.error(errorMessage)
+            return
+
+        # Run the command and get output
+        self.addInterval(start, end)
+
+        # Display output to screen
+        self.printIntervals()
+
+    def do_addBatch(self, args):
+        """
+        Add several intervals to the interval list at once
+        Usage: addBatch <start> <end> [<start> <end> ...]
+               each <start> must be less than its <end>
+        """
+
         """
         Get user input and check for input errors
         """
         cmdArgs = args.split()
 
-        if len(cmdArgs) == 0:
-            self._m_Logger.error("Error - No arguments passed\Usage: add <start> <end>")
+        if len(cmdArgs) == 0 or len(cmdArgs) % 2 == 1:
+            self._m_Logger.error("Error - Need an even number of arguments\nUsage: addBatch <start> <end> [<start> <end> ...]")
             return
 
-        elif len(cmdArgs) == 1:
-            self._m_Logger.error("Error - Only one argument passed (Need at least 2)\nFormat: add <start> <end>")
+        try:
+            values = [int(arg) for arg in cmdArgs]
+        except ValueError:
+            self._m_Logger.error("Error - Inputs must be integer values")
             return
 
-        else:
-            try:
-                start = int(cmdArgs[0])
-                end = int(cmdArgs[1])
-            except ValueError:
-                self._m_Logger.error("Error - Inputs must be integer values")
-                return
+        if min(values) < MIN_INTERVAL_VALUE or max(values) > MAX_INTERVAL_VALUE:
+            self._m_Logger.error("Error - Inputs must be between %d and %d", MIN_INTERVAL_VALUE, MAX_INTERVAL_VALUE)
+            return
 
+        intervals = list(zip(values[0::2], values[1::2]))
+
+        for start, end in intervals:
             if start >= end:
-                self._m_Logger.error("Error - start must be < end\Usage: add <start> <end>")
+                self._m_Logger.error("Error - start must be < end\nUsage: addBatch <start> <end> [<start> <end> ...]")
                 return
 
-            # Run the command and get output
-            self.addInterval(start, end)
+        # Run the command and get output
+        self.addIntervals(intervals)
 
-            # Display output to screen
-            self.printIntervals()
+        # Display output to screen
+        self.printIntervals()
 
     def do_remove(self, args):
         """
@@ -638,33 +510,17 @@ class EditIntervalsProgram(object, cmd.Cmd):
         """
         Get user input and check for input errors
         """
-        cmdArgs = args.split()
-
-        if len(cmdArgs) == 0:
-            self._m_Logger.error("Error - No arguments passed\Usage: remove <start> <end>")
-            return
+        start, end, errorMessage = _parseIntervalArgs('remove', args)
 
-        elif len(cmdArgs) == 1:
-            self._m_Logger.error("Error - Only one argument passed (Need at least 2)\Usage: remove <start> <end>")
+        if errorMessage is not None:
+            self._m_Logger.error(errorMessage)
             return
 
-        else:
-            try:
-                start = int(cmdArgs[0])
-                end = int(cmdArgs[1])
-            except ValueError:
-                self._m_Logger.error("Error - Inputs must be integer values")
-                return
-
-            if start >= end:
-                self._m_Logger.error("Error - start must be < end\Usage: remove <start> <end>")
-                return
-
-            # Run the command and get output
-            self.removeInterval(start, end)
+        # Run the command and get output
+        self.removeInterval(start, end)
 
-            # Display output to screen
-            self.printIntervals()
+        # Display output to screen
+        self.printIntervals()
 
     def do_clear(self, args):
         """
@@ -705,6 +561,43 @@ class EditIntervalsProgram(object, cmd.Cmd):
         """
         return True
 
+    def cmdloop(self, intro=None):
+        """
+        Run the command loop
+
+        When stdin is a terminal this is the regular cmd.Cmd loop.
+        When stdin is not a terminal (e.g. commands piped in from a
+        script), stdin is read line by line and each command is
+        dispatched straight to its do_* method, skipping the prompt
+        and readline handling.  Blank lines are ignored and the loop
+        ends at the end of the input.
+        """
+        if sys.stdin.isatty():
+            return super().cmdloop(intro)
+
+        if intro is not None:
+            sys.stdout.write(str(intro) + '\n')
+
+        # Map each command name to its do_* method once, up front
+        handlers = {name[3:]: getattr(self, name) for name in self.get_names() if name.startswith('do_')}
+
+        self.preloop()
+        for line in sys.stdin:
+            command, cmdArgs, line = self.parseline(line.strip())
+
+            if not line:
+                continue
+
+            handler = handlers.get(command)
+            if handler is None:
+                stop = self.default(line)
+            else:
+                stop = handler(cmdArgs)
+
+            if stop:
+                break
+        self.postloop()
+
 
 # Main method for script
 def main():